@@ -5,14 +5,195 @@ Drop-in replacement for LangChain's AzureBlobStorageContainerLoader that properl
 supports service principal authentication via Entra ID.
 """
 
+import asyncio
+import functools
+import logging
+import multiprocessing
 import os
-import tempfile
-from typing import List, Optional, Pattern
+import re
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import nullcontext
+from io import BytesIO
+from queue import Queue
+from threading import Lock
+from typing import Iterable, List, Optional, Pattern
 from langchain_core.documents import Document
 from langchain_community.document_loaders.base import BaseLoader
-from langchain_unstructured import UnstructuredLoader
-from azure.identity import DefaultAzureCredential, ClientSecretCredential
-from azure.storage.blob import BlobServiceClient
+from azure_blob_entra_loader import _get_default_credential, _spool
+
+logger = logging.getLogger(__name__)
+
+# The Azure SDK and unstructured pull in large dependency trees (MSAL, onnxruntime, ...),
+# so they are imported where first needed rather than when this module is imported
+
+# Page size for LIST requests (the service maximum)
+_LIST_PAGE_SIZE = 5000
+
+# Regex characters that are not literals when unescaped
+_REGEX_METACHARACTERS = frozenset(".^$*+?{}[]\\|()")
+
+# Escapes that run on past their first character: \xNN, \uNNNN, \N{...}, octal, backreferences
+_MULTICHAR_ESCAPES = frozenset("xuUN0123456789")
+
+
+def _tokenize_pattern(source: str) -> Optional[List[tuple]]:
+    """
+    Split a regex into (is_literal, text) tokens; character classes become one token.
+    
+    Returns None for patterns with escapes longer than two characters outside a class,
+    whose trailing digits would otherwise be mistaken for literals.
+    """
+    tokens = []
+    i = 0
+    while i < len(source):
+        char = source[i]
+        if char == "\\" and i + 1 < len(source):
+            # Escaped letters and digits are classes, anchors or backreferences
+            escaped = source[i + 1]
+            if escaped in _MULTICHAR_ESCAPES:
+                return None
+            tokens.append((not escaped.isalnum(), "\\" + escaped if escaped.isalnum() else escaped))
+            i += 2
+        elif char == "[":
+            end = i + 1
+            if end < len(source) and source[end] == "^":
+                end += 1
+            if end < len(source) and source[end] == "]":
+                end += 1
+            while end < len(source) and source[end] != "]":
+                end += 2 if source[end] == "\\" else 1
+            tokens.append((False, source[i:end + 1]))
+            i = end + 1
+        else:
+            tokens.append((char not in _REGEX_METACHARACTERS, char))
+            i += 1
+    return tokens
+
+
+def _literal_suffixes(pattern: Pattern[str]) -> Optional[tuple]:
+    """
+    Return the literal endings an end-anchored pattern forces every match to have.
+    
+    Handles simple patterns such as r"\.pdf$" or r"\.(pdf|docx)$" and returns None for
+    anything it can't prove, so callers fall back to the regex alone. With IGNORECASE
+    the endings are casefolded and names must be casefolded before comparing.
+    """
+    source = pattern.pattern
+    if not isinstance(source, str) or pattern.flags & (re.MULTILINE | re.VERBOSE):
+        return None
+    
+    tokens = _tokenize_pattern(source)
+    if not tokens or tokens[-1] not in ((False, "$"), (False, "\\Z")):
+        return None
+    
+    # A top-level alternation would let some branches skip the anchor entirely
+    depth = 0
+    for token in tokens:
+        if token == (False, "("):
+            depth += 1
+        elif token == (False, ")"):
+            depth -= 1
+        elif token == (False, "|") and depth == 0:
+            return None
+    
+    # An optional trailing group of plain alternatives, e.g. (pdf|docx) or (?:pdf|docx)
+    end = len(tokens) - 1
+    alternatives = [""]
+    if end > 0 and tokens[end - 1] == (False, ")"):
+        start = end - 2
+        while start >= 0 and tokens[start] not in ((False, "("), (False, ")")):
+            start -= 1
+        if start < 0 or tokens[start] != (False, "("):
+            return None
+        body = tokens[start + 1:end - 1]
+        if body[:1] == [(False, "?")]:
+            if body[1:2] != [(True, ":")]:
+                return None
+            body = body[2:]
+        alternatives = [[]]
+        for is_literal, text in body:
+            if (is_literal, text) == (False, "|"):
+                alternatives.append([])
+            elif is_literal:
+                alternatives[-1].append(text)
+            else:
+                return None
+        alternatives = ["".join(parts) for parts in alternatives]
+        end = start
+    
+    # Literal characters right before the anchor (or the group) are shared by every ending
+    shared = []
+    for is_literal, text in reversed(tokens[:end]):
+        if not is_literal:
+            break
+        shared.append(text)
+    shared = "".join(reversed(shared))
+    
+    suffixes = tuple(shared + alternative for alternative in alternatives)
+    if not all(suffixes):
+        return None
+    if pattern.flags & re.IGNORECASE:
+        if not all(suffix.isascii() for suffix in suffixes):
+            return None
+        suffixes = tuple(suffix.casefold() for suffix in suffixes)
+    return suffixes
+
+
+# Parsed documents keyed by blob URL, ETag and credential; the ETag changes whenever the
+# blob's content does, so an entry can never be stale. Bounded by total text size, since
+# one large PDF can produce more text than hundreds of small blobs
+_PARSE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+_parse_cache = OrderedDict()
+_parse_cache_lock = Lock()
+_parse_cache_bytes = 0
+
+
+def _get_cached_documents(key: Optional[tuple]) -> Optional[List[Document]]:
+    """Return fresh copies of cached documents for a blob, or None on a miss."""
+    if key is None:
+        return None
+    with _parse_cache_lock:
+        entry = _parse_cache.get(key)
+        if entry is None:
+            return None
+        _parse_cache.move_to_end(key)
+    return [Document(page_content=content, metadata=dict(metadata)) for content, metadata in entry[0]]
+
+
+def _cache_documents(key: Optional[tuple], docs: List[Document]) -> None:
+    """Remember a blob's parsed documents, evicting least recently used blobs to stay in budget."""
+    global _parse_cache_bytes
+    
+    if key is None:
+        return
+    size = sum(len(doc.page_content) for doc in docs)
+    if size > _PARSE_CACHE_MAX_BYTES:
+        return
+    entry = (tuple((doc.page_content, dict(doc.metadata)) for doc in docs), size)
+    with _parse_cache_lock:
+        previous = _parse_cache.pop(key, None)
+        if previous:
+            _parse_cache_bytes -= previous[1]
+        _parse_cache[key] = entry
+        _parse_cache_bytes += size
+        while _parse_cache_bytes > _PARSE_CACHE_MAX_BYTES:
+            _, evicted = _parse_cache.popitem(last=False)
+            _parse_cache_bytes -= evicted[1]
+
+
+def _parse_bytes(data: bytes, filename: str) -> List[dict]:
+    """Parse a blob payload into plain element dicts; module-level so process pools can pickle it."""
+    from langchain_unstructured import UnstructuredLoader
+    
+    loader = UnstructuredLoader(file=BytesIO(data), metadata_filename=filename)
+    return [{"page_content": doc.page_content, "metadata": doc.metadata} for doc in loader.load()]
+
+
+def _parse_pool_context():
+    """Start method for parse worker processes that doesn't fork the calling process."""
+    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    return multiprocessing.get_context(method)
 
 
 class AzureBlobStorageContainerEntraLoader(BaseLoader):
@@ -29,6 +210,9 @@ class AzureBlobStorageContainerEntraLoader(BaseLoader):
             container="documents"
         )
         documents = loader.load()
+        
+        # Or, from async code
+        documents = await loader.aload()
     """
     
     def __init__(
@@ -38,6 +222,16 @@ class AzureBlobStorageContainerEntraLoader(BaseLoader):
         prefix: Optional[str] = None,
         credential=None,
         file_pattern: Optional[Pattern[str]] = None,
+        max_concurrency: int = 16,
+        download_concurrency: int = 8,
+        chunk_size: int = 16 * 1024 * 1024,
+        async_credential=None,
+        max_in_memory_bytes: int = 32 * 1024 * 1024,
+        parse_processes: Optional[int] = None,
+        cache_parsed: bool = True,
+        max_blob_bytes: Optional[int] = None,
+        allowed_content_types: Optional[Iterable[str]] = None,
+        blob_service_client=None,
     ):
         """
         Initialize the loader.
@@ -48,74 +242,335 @@ class AzureBlobStorageContainerEntraLoader(BaseLoader):
             prefix: Optional prefix to filter blobs (e.g., 'reports/' for files in reports folder)
             credential: Azure credential. If None, uses DefaultAzureCredential which 
                        automatically detects service principal credentials from environment
-            file_pattern: Optional regex pattern to filter files by name
+            file_pattern: Optional regex pattern searched for in each blob name
+                       (e.g. re.compile(r"\.pdf$"))
+            max_concurrency: Maximum number of blobs downloaded and parsed in parallel
+            download_concurrency: Number of parallel range requests used to download each blob
+            chunk_size: Size in bytes of each ranged GET issued when downloading a blob
+            async_credential: Async Azure credential used by aload(). If None, an
+                       azure.identity.aio ClientSecretCredential is built from the
+                       same service principal environment variables
+            max_in_memory_bytes: Blobs larger than this are spooled to a temporary file
+                       while downloading instead of being held in memory
+            parse_processes: Number of worker processes used to parse blobs in load().
+                       If None, blobs are parsed on one thread per CPU; set it (e.g. to
+                       os.cpu_count()) when parsing is CPU-heavy, such as PDF layout or OCR
+            cache_parsed: Reuse parsed documents for blobs whose ETag hasn't changed since
+                       an earlier load in this process, skipping download and parsing
+            max_blob_bytes: Optional size limit; larger blobs are skipped with a warning
+            allowed_content_types: Optional set of content types to load, such as
+                       {"application/pdf", "text/*"}; other blobs are skipped
+            blob_service_client: Optional pre-built BlobServiceClient to reuse, sharing its
+                       connection pool with the rest of the application. Requests then use
+                       its credential and transfer settings, so chunk_size only applies to
+                       clients this loader builds itself
         """
         self.storage_account_name = storage_account_name
         self.container = container
         self.prefix = prefix
-        self.credential = credential or ClientSecretCredential(
-            tenant_id=os.getenv("AZURE_TENANT_ID"),
-            client_id=os.getenv("AZURE_CLIENT_ID"),
-            client_secret=os.getenv("AZURE_CLIENT_SECRET")
-        )
+        self.credential = credential or getattr(blob_service_client, "credential", None) or _get_default_credential()
         self.file_pattern = file_pattern
-        self.account_url = f"https://{storage_account_name}.blob.core.windows.net"
+        self._pattern_suffixes = _literal_suffixes(file_pattern) if file_pattern else None
+        self.max_concurrency = max_concurrency
+        self.download_concurrency = download_concurrency
+        self.chunk_size = chunk_size
+        self.async_credential = async_credential
+        self.max_in_memory_bytes = max_in_memory_bytes
+        self.parse_processes = parse_processes
+        self.cache_parsed = cache_parsed
+        self.max_blob_bytes = max_blob_bytes
+        self.allowed_content_types = (
+            frozenset(content_type.lower() for content_type in allowed_content_types)
+            if allowed_content_types else None
+        )
+        self._service = blob_service_client
+        self._client = None
         
+    @functools.cached_property
+    def account_url(self) -> str:
+        """Blob service endpoint, computed on first use."""
+        return f"https://{self.storage_account_name}.blob.core.windows.net"
+    
+    @functools.cached_property
+    def _source_prefix(self) -> str:
+        """Constant account/container part of each document's source URL."""
+        return f"{self.account_url}/{self.container}"
+    
+    @property
+    def _container_client(self):
+        """Container client, built on first use and reused across load() calls."""
+        if self._client is None:
+            if self._service is None:
+                from azure.storage.blob import BlobServiceClient
+                
+                # Keep the initial GET at one chunk so larger blobs are fetched as parallel ranges
+                self._service = BlobServiceClient(
+                    account_url=self.account_url,
+                    credential=self.credential,
+                    max_single_get_size=self.chunk_size,
+                    max_chunk_get_size=self.chunk_size
+                )
+            self._client = self._service.get_container_client(self.container)
+        return self._client
+    
     def load(self) -> List[Document]:
         """Load documents from the container."""
-        blob_service_client = BlobServiceClient(
-            account_url=self.account_url,
-            credential=self.credential
+        container_client = self._container_client
+        
+        # List blobs page by page with optional prefix, skipping those the file pattern rejects
+        pages = container_client.list_blobs(
+            name_starts_with=self.prefix,
+            results_per_page=_LIST_PAGE_SIZE
+        ).by_page()
+        blobs = [blob for page in pages for blob in self._filter_page(page)]
+        if not blobs:
+            return []
+        
+        # Parsing escapes the GIL in worker processes when requested; downloads stay on threads.
+        # Workers start lazily from a parser thread while downloads run, so never fork this
+        # multi-threaded process; forkserver or spawn start them from a clean interpreter
+        parse_pool = (
+            ProcessPoolExecutor(max_workers=self.parse_processes, mp_context=_parse_pool_context())
+            if self.parse_processes else nullcontext()
         )
+        parser_count = self.parse_processes or os.cpu_count() or 1
+        
+        # Downloads feed parsers through a bounded queue, so both stages run at once while
+        # downloads can't get more than a couple of batches ahead of parsing
+        downloaded = Queue(maxsize=2 * self.max_concurrency)
+        results = [[] for _ in blobs]
         
-        container_client = blob_service_client.get_container_client(self.container)
-        documents = []
+        with parse_pool as pool, \
+                ThreadPoolExecutor(max_workers=self.max_concurrency) as downloaders, \
+                ThreadPoolExecutor(max_workers=parser_count) as parsers:
+            parser_futures = [
+                parsers.submit(self._parse_worker, downloaded, pool, results)
+                for _ in range(parser_count)
+            ]
+            download_futures = [
+                downloaders.submit(self._download_worker, container_client, index, blob, downloaded, results)
+                for index, blob in enumerate(blobs)
+            ]
+            try:
+                for future in download_futures:
+                    future.result()
+            finally:
+                # One sentinel per parser once every download has been queued
+                for _ in parser_futures:
+                    downloaded.put(None)
+            for future in parser_futures:
+                future.result()
         
-        # List blobs with optional prefix
-        blobs = container_client.list_blobs(name_starts_with=self.prefix)
+        # Results are slotted by listing index so the output order stays deterministic
+        return [doc for docs in results for doc in docs]
+    
+    async def aload(self) -> List[Document]:
+        """Asynchronously load documents from the container."""
+        from azure.identity.aio import ClientSecretCredential as AsyncClientSecretCredential
+        from azure.storage.blob.aio import BlobServiceClient as AsyncBlobServiceClient
         
-        for blob in blobs:
-            # Skip if file pattern doesn't match
-            if self.file_pattern and not self.file_pattern.match(blob.name):
-                continue
+        credential = self.async_credential or AsyncClientSecretCredential(
+            tenant_id=os.getenv("AZURE_TENANT_ID"),
+            client_id=os.getenv("AZURE_CLIENT_ID"),
+            client_secret=os.getenv("AZURE_CLIENT_SECRET")
+        )
+        # Cache under the identity that actually downloads; a credential built per call is
+        # keyed by its service principal so repeated aload() calls can still share entries
+        cache_identity = self.async_credential or (
+            "aio", os.getenv("AZURE_TENANT_ID"), os.getenv("AZURE_CLIENT_ID")
+        )
+        
+        try:
+            async with AsyncBlobServiceClient(
+                account_url=self.account_url,
+                credential=credential,
+                max_single_get_size=self.chunk_size,
+                max_chunk_get_size=self.chunk_size
+            ) as blob_service_client:
+                container_client = blob_service_client.get_container_client(self.container)
+                semaphore = asyncio.Semaphore(self.max_concurrency)
                 
-            try:
-                blob_client = container_client.get_blob_client(blob.name)
+                # Start downloading matching blobs while the listing is still paging in
+                tasks = []
+                pages = container_client.list_blobs(
+                    name_starts_with=self.prefix,
+                    results_per_page=_LIST_PAGE_SIZE
+                ).by_page()
+                async for page in pages:
+                    for blob in self._filter_page([blob async for blob in page]):
+                        tasks.append(asyncio.create_task(
+                            self._aprocess_blob(container_client, blob, semaphore, cache_identity)
+                        ))
                 
-                # Use temporary directory for processing
-                with tempfile.TemporaryDirectory() as temp_dir:
-                    # Create file path maintaining blob structure
-                    file_path = os.path.join(temp_dir, self.container, blob.name)
-                    os.makedirs(os.path.dirname(file_path), exist_ok=True)
-                    
-                    # Download blob to temp file
-                    with open(file_path, "wb") as file:
-                        blob_data = blob_client.download_blob()
-                        blob_data.readinto(file)
-                    
-                    # Use UnstructuredLoader to parse the document
-                    loader = UnstructuredLoader(file_path)
-                    docs = loader.load()
-                    
-                    # Add Azure blob metadata to documents
-                    for doc in docs:
-                        doc.metadata.update({
-                            "source": f"{self.account_url}/{self.container}/{blob.name}",
-                            "blob_name": blob.name,
-                            "container": self.container,
-                            "storage_account": self.storage_account_name,
-                            "file_size": blob.size,
-                            "last_modified": blob.last_modified.isoformat() if blob.last_modified else None,
-                            "content_type": blob.content_settings.content_type if blob.content_settings else None,
-                        })
-                    
-                    documents.extend(docs)
-                    
+                results = await asyncio.gather(*tasks)
+        finally:
+            # Only close credentials this loader created
+            if self.async_credential is None:
+                await credential.close()
+        
+        return [doc for docs in results for doc in docs]
+    
+    def _filter_page(self, page) -> list:
+        """Return the blobs in one LIST page worth downloading."""
+        # Sizes and content types come with the listing, so degenerate blobs cost nothing
+        blobs = [blob for blob in page if blob.size]
+        if self.file_pattern:
+            # Cheap suffix test first so most non-matching names never reach the regex engine
+            suffixes, search = self._pattern_suffixes, self.file_pattern.search
+            if suffixes and self.file_pattern.flags & re.IGNORECASE:
+                blobs = [blob for blob in blobs if blob.name.casefold().endswith(suffixes)]
+            elif suffixes:
+                blobs = [blob for blob in blobs if blob.name.endswith(suffixes)]
+            blobs = [blob for blob in blobs if search(blob.name)]
+        
+        # Limits run last so only blobs the pattern wanted can log a skip warning
+        return [blob for blob in blobs if self._within_limits(blob)]
+    
+    def _within_limits(self, blob) -> bool:
+        """Check a non-empty blob against max_blob_bytes and allowed_content_types."""
+        if self.max_blob_bytes and blob.size > self.max_blob_bytes:
+            logger.warning("Skipping blob %s: %s bytes exceeds max_blob_bytes", blob.name, blob.size)
+            return False
+        
+        if self.allowed_content_types is None:
+            return True
+        content_type = blob.content_settings.content_type if blob.content_settings else None
+        if not content_type:
+            # Nothing to judge by; let the parser sniff the format
+            return True
+        content_type = content_type.split(";", 1)[0].strip().lower()
+        return (
+            content_type in self.allowed_content_types
+            or f"{content_type.split('/', 1)[0]}/*" in self.allowed_content_types
+        )
+    
+    def _download_worker(self, container_client, index: int, blob, downloaded: Queue, results: list) -> None:
+        """Download one blob and queue it for parsing, unless the parse cache has it."""
+        cache_key = self._cache_key(blob, self.credential)
+        cached = _get_cached_documents(cache_key)
+        if cached is not None:
+            results[index] = cached
+            return
+        
+        try:
+            buffer = self._download(container_client, blob)
+        except Exception as e:
+            logger.warning("Failed to process blob %s: %s", blob.name, e)
+            return
+        
+        downloaded.put((index, blob, buffer, cache_key))
+    
+    def _parse_worker(self, downloaded: Queue, parse_pool, results: list) -> None:
+        """Parse queued downloads until a sentinel arrives."""
+        while True:
+            item = downloaded.get()
+            if item is None:
+                return
+            
+            index, blob, buffer, cache_key = item
+            try:
+                with buffer:
+                    # unstructured accepts a SpooledTemporaryFile directly, in memory or rolled over
+                    buffer.seek(0)
+                    docs = self._parse_payload(buffer, blob, parse_pool)
             except Exception as e:
-                print(f"Warning: Failed to process blob {blob.name}: {e}")
+                logger.warning("Failed to process blob %s: %s", blob.name, e)
                 continue
+            
+            _cache_documents(cache_key, docs)
+            results[index] = docs
+    
+    async def _aprocess_blob(self, container_client, blob, semaphore, cache_identity) -> List[Document]:
+        """Asynchronously download a single blob, then parse it off the event loop."""
+        cache_key = self._cache_key(blob, cache_identity)
+        cached = _get_cached_documents(cache_key)
+        if cached is not None:
+            return cached
+        
+        async with semaphore:
+            try:
+                docs = await self._adownload_and_parse(container_client, blob)
+            except Exception as e:
+                logger.warning("Failed to process blob %s: %s", blob.name, e)
+                return []
+        
+        _cache_documents(cache_key, docs)
+        return docs
+    
+    def _download(self, container_client, blob):
+        """Download one blob into a spool, returning the spool."""
+        blob_client = container_client.get_blob_client(blob.name)
+        
+        # Small blobs stay in memory; large ones spill to disk so memory stays bounded
+        buffer = _spool(self.max_in_memory_bytes, blob.size)
+        try:
+            blob_data = blob_client.download_blob(max_concurrency=self.download_concurrency)
+            size = blob_data.readinto(buffer)
+            buffer.truncate(size)
+        except BaseException:
+            buffer.close()
+            raise
+        return buffer
+    
+    def _parse_payload(self, payload, blob, parse_pool) -> List[Document]:
+        """Parse a downloaded blob in this process, or in the parse pool when there is one."""
+        if parse_pool is None:
+            return self._parse_stream(payload, blob)
+        
+        elements = parse_pool.submit(_parse_bytes, payload.read(), blob.name).result()
+        return self._add_blob_metadata([Document(**element) for element in elements], blob)
+    
+    async def _adownload_and_parse(self, container_client, blob) -> List[Document]:
+        """Asynchronously download one blob and parse it in the default executor."""
+        blob_client = container_client.get_blob_client(blob.name)
+        
+        with _spool(self.max_in_memory_bytes, blob.size) as buffer:
+            blob_data = await blob_client.download_blob(max_concurrency=self.download_concurrency)
+            size = await blob_data.readinto(buffer)
+            buffer.truncate(size)
+            
+            # Parsing is CPU-bound, so keep it out of the event loop
+            buffer.seek(0)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self._parse_stream, buffer, blob)
+    
+    def _cache_key(self, blob, credential) -> Optional[tuple]:
+        """Key for the parse cache, or None when this blob shouldn't be cached."""
+        if not self.cache_parsed or not blob.etag:
+            return None
+        # The credential that downloads is part of the key so one identity's results never
+        # serve another; holding it, unlike its id(), means a collected credential's id
+        # can't be reused by a new one while entries remain. Unhashable ones aren't cached
+        try:
+            hash(credential)
+        except TypeError:
+            return None
+        return (f"{self._source_prefix}/{blob.name}", blob.etag, credential)
+    
+    def _parse_stream(self, stream, blob) -> List[Document]:
+        """Parse a downloaded blob payload in this process."""
+        from langchain_unstructured import UnstructuredLoader
+        
+        # Use UnstructuredLoader to parse the document
+        loader = UnstructuredLoader(file=stream, metadata_filename=blob.name)
+        return self._add_blob_metadata(loader.load(), blob)
+    
+    def _add_blob_metadata(self, docs: List[Document], blob) -> List[Document]:
+        """Attach Azure blob metadata to parsed documents."""
+        # Built once per blob and shared by every element it produced
+        blob_metadata = {
+            "source": f"{self._source_prefix}/{blob.name}",
+            "blob_name": blob.name,
+            "container": self.container,
+            "storage_account": self.storage_account_name,
+            "file_size": blob.size,
+            "last_modified": blob.last_modified.isoformat() if blob.last_modified else None,
+            "content_type": blob.content_settings.content_type if blob.content_settings else None,
+        }
+        for doc in docs:
+            doc.metadata.update(blob_metadata)
         
-        return documents
+        return docs
 
 
 def load_azure_blob_documents(
@@ -160,7 +615,6 @@ def load_azure_blob_documents(
 
 
 if __name__ == "__main__":
-    import re
     from dotenv import load_dotenv
     
     load_dotenv()
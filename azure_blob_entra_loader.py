@@ -3,14 +3,77 @@ Robust Azure Blob Storage Loader using Entra ID
 This custom loader combines the simplicity of Entra ID auth with proper document parsing
 """
 
+import asyncio
+import functools
+import logging
 import os
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from itertools import islice
 from typing import List, Optional
 from langchain_core.documents import Document
 from langchain_community.document_loaders.base import BaseLoader
-from langchain_unstructured import UnstructuredLoader
-from azure.identity import DefaultAzureCredential, ClientSecretCredential
-from azure.storage.blob import BlobServiceClient
+
+logger = logging.getLogger(__name__)
+
+# The Azure SDK and unstructured pull in large dependency trees (MSAL, onnxruntime, ...),
+# so they are imported where first needed rather than when this module is imported
+
+# Write buffer used once a blob spills from memory to its temporary file
+_SPOOL_BUFFER_SIZE = 4 * 1024 * 1024
+
+# Formats that still parse when cut off part-way, so load_head() can read just a prefix
+_HEAD_READABLE_EXTENSIONS = frozenset({
+    ".txt", ".text", ".md", ".markdown", ".rst", ".log", ".csv", ".tsv", ".html", ".htm"
+})
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_credential(tenant_id: str, client_id: str, client_secret: str):
+    """Return one ClientSecretCredential (and MSAL token cache) per service principal."""
+    from azure.identity import ClientSecretCredential
+    
+    return ClientSecretCredential(
+        tenant_id=tenant_id,
+        client_id=client_id,
+        client_secret=client_secret
+    )
+
+
+def _get_default_credential():
+    """Return the shared credential for the service principal in the environment."""
+    return _cached_credential(
+        os.getenv("AZURE_TENANT_ID"),
+        os.getenv("AZURE_CLIENT_ID"),
+        os.getenv("AZURE_CLIENT_SECRET")
+    )
+
+
+def _spool(max_in_memory_bytes: int, expected_size: Optional[int] = None):
+    """Return a buffer that keeps small blobs in memory and spills large ones to disk."""
+    spool = tempfile.SpooledTemporaryFile(
+        max_size=max_in_memory_bytes,
+        buffering=_SPOOL_BUFFER_SIZE
+    )
+    if expected_size and expected_size <= max_in_memory_bytes:
+        # Reserve the listed size up front so the in-memory buffer is allocated once
+        # and the downloader's writes land in place instead of regrowing it
+        spool.seek(expected_size - 1)
+        spool.write(b"\0")
+        spool.seek(0)
+    return spool
+
+
+def _trim_partial_utf8(data: bytes) -> bytes:
+    """Drop a UTF-8 sequence left incomplete at the end of a byte range."""
+    # Walk back over continuation bytes to the lead byte of the last character
+    for back in range(1, min(4, len(data)) + 1):
+        byte = data[-back]
+        if byte & 0xC0 != 0x80:
+            length = 1 if byte < 0xC0 else 2 if byte < 0xE0 else 3 if byte < 0xF0 else 4
+            return data[:-back] if length > back else data
+    return data
 
 
 class AzureBlobStorageEntraLoader(BaseLoader):
@@ -21,7 +84,14 @@ class AzureBlobStorageEntraLoader(BaseLoader):
         storage_account_name: str, 
         container_name: str,
         blob_name: Optional[str] = None,
-        credential=None
+        credential=None,
+        max_concurrency: int = 16,
+        download_concurrency: int = 8,
+        chunk_size: int = 16 * 1024 * 1024,
+        async_credential=None,
+        max_in_memory_bytes: int = 32 * 1024 * 1024,
+        blob_names: Optional[List[str]] = None,
+        blob_service_client=None
     ):
         """
         Initialize the loader.
@@ -31,71 +101,225 @@ class AzureBlobStorageEntraLoader(BaseLoader):
             container_name: Name of the container
             blob_name: Optional specific blob name. If None, loads all blobs in container
             credential: Azure credential (defaults to DefaultAzureCredential)
+            max_concurrency: Maximum number of blobs downloaded and parsed in parallel
+            download_concurrency: Number of parallel range requests used to download each blob
+            chunk_size: Size in bytes of each ranged GET issued when downloading a blob
+            async_credential: Async Azure credential used by aload() (defaults to an
+                              azure.identity.aio ClientSecretCredential from env vars)
+            max_in_memory_bytes: Blobs larger than this are spooled to a temporary file
+                                 while downloading instead of being held in memory
+            blob_names: Optional list of specific blobs to load in parallel (used together
+                        with blob_name if both are given)
+            blob_service_client: Optional pre-built BlobServiceClient to reuse, sharing its
+                                 connection pool; requests then use its credential and
+                                 transfer settings instead of credential and chunk_size
         """
         self.storage_account_name = storage_account_name
         self.container_name = container_name
         self.blob_name = blob_name
-        self.credential = credential or ClientSecretCredential(
+        self.blob_names = blob_names
+        self.credential = credential or getattr(blob_service_client, "credential", None) or _get_default_credential()
+        self.max_concurrency = max_concurrency
+        self.download_concurrency = download_concurrency
+        self.chunk_size = chunk_size
+        self.async_credential = async_credential
+        self.max_in_memory_bytes = max_in_memory_bytes
+        self._service = blob_service_client
+        self._client = None
+        
+    @functools.cached_property
+    def account_url(self) -> str:
+        """Blob service endpoint, computed on first use."""
+        return f"https://{self.storage_account_name}.blob.core.windows.net"
+    
+    @functools.cached_property
+    def _source_prefix(self) -> str:
+        """Constant account/container part of each document's source URL."""
+        return f"{self.account_url}/{self.container_name}"
+    
+    @property
+    def _container_client(self):
+        """Container client, built on first use and reused across load() calls."""
+        if self._client is None:
+            if self._service is None:
+                from azure.storage.blob import BlobServiceClient
+                
+                # Keep the initial GET at one chunk so larger blobs are fetched as parallel ranges
+                self._service = BlobServiceClient(
+                    account_url=self.account_url,
+                    credential=self.credential,
+                    max_single_get_size=self.chunk_size,
+                    max_chunk_get_size=self.chunk_size
+                )
+            self._client = self._service.get_container_client(self.container_name)
+        return self._client
+    
+    def load(self, max_chunks: Optional[int] = None) -> List[Document]:
+        """
+        Load documents from blob storage.
+        
+        Args:
+            max_chunks: Optional cap on the number of document elements kept per blob
+        """
+        container_client = self._container_client
+        
+        # Get list of blobs to process
+        if self.blob_name or self.blob_names is not None:
+            # Load specific blobs; an empty blob_names list loads nothing, not the container
+            blobs = self._requested_blobs()
+        else:
+            # Load all blobs in container; names only, so skip parsing blob properties
+            blobs = list(container_client.list_blob_names())
+        
+        # Process blobs in parallel; the service client is shared by all workers
+        documents = []
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            futures = [
+                executor.submit(self._process_blob, container_client, blob_name, max_chunks)
+                for blob_name in blobs
+            ]
+            # Collect in listing order so results stay deterministic
+            for future in futures:
+                documents.extend(future.result())
+        
+        return documents
+    
+    async def aload(self) -> List[Document]:
+        """Asynchronously load documents from blob storage."""
+        from azure.identity.aio import ClientSecretCredential as AsyncClientSecretCredential
+        from azure.storage.blob.aio import BlobServiceClient as AsyncBlobServiceClient
+        
+        credential = self.async_credential or AsyncClientSecretCredential(
             tenant_id=os.getenv("AZURE_TENANT_ID"),
             client_id=os.getenv("AZURE_CLIENT_ID"),
             client_secret=os.getenv("AZURE_CLIENT_SECRET")
         )
-        self.account_url = f"https://{storage_account_name}.blob.core.windows.net"
         
-    def load(self) -> List[Document]:
-        """Load documents from blob storage."""
-        blob_service_client = BlobServiceClient(
-            account_url=self.account_url,
-            credential=self.credential
-        )
+        try:
+            async with AsyncBlobServiceClient(
+                account_url=self.account_url,
+                credential=credential,
+                max_single_get_size=self.chunk_size,
+                max_chunk_get_size=self.chunk_size
+            ) as blob_service_client:
+                container_client = blob_service_client.get_container_client(self.container_name)
+                semaphore = asyncio.Semaphore(self.max_concurrency)
+                
+                # Get list of blobs to process
+                if self.blob_name or self.blob_names is not None:
+                    blobs = self._requested_blobs()
+                else:
+                    blobs = [name async for name in container_client.list_blob_names()]
+                
+                results = await asyncio.gather(*[
+                    self._aprocess_blob(container_client, blob_name, semaphore)
+                    for blob_name in blobs
+                ])
+        finally:
+            # Only close credentials this loader created
+            if self.async_credential is None:
+                await credential.close()
         
-        container_client = blob_service_client.get_container_client(self.container_name)
-        documents = []
+        return [doc for docs in results for doc in docs]
+    
+    def can_load_head(self) -> bool:
+        """Whether load_head() can parse just the start of blob_name instead of the whole blob."""
+        return bool(self.blob_name) and os.path.splitext(self.blob_name)[1].lower() in _HEAD_READABLE_EXTENSIONS
+    
+    def load_head(self, max_bytes: int, max_chunks: Optional[int] = None) -> List[Document]:
+        """
+        Load documents from only the first max_bytes of blob_name.
         
-        # Get list of blobs to process
-        if self.blob_name:
-            # Load specific blob
-            blobs = [self.blob_name]
-        else:
-            # Load all blobs in container
-            blobs = [blob.name for blob in container_client.list_blobs()]
+        Uses a single ranged GET for text-like formats; binary formats such as PDF can't be
+        parsed from a prefix, so they fall back to a full load().
         
-        # Process each blob
-        for blob_name in blobs:
+        Args:
+            max_bytes: Number of bytes to read from the start of the blob
+            max_chunks: Optional cap on the number of document elements kept
+        """
+        if not self.blob_name:
+            raise ValueError("load_head() requires blob_name")
+        if not self.can_load_head():
+            return self.load(max_chunks=max_chunks)
+        
+        try:
+            blob_client = self._container_client.get_blob_client(self.blob_name)
+            data = blob_client.download_blob(offset=0, length=max_bytes).readall()
+            
+            # Cut at the last line break so no line or multi-byte character is split; a
+            # single-line head (minified HTML, one long CSV row) loses only a cut-off character
+            if len(data) >= max_bytes:
+                cut = data.rfind(b"\n")
+                data = data[:cut + 1] if cut > 0 else _trim_partial_utf8(data)
+            
+            return self._parse_stream(BytesIO(data), self.blob_name, max_chunks)
+            
+        except Exception as e:
+            logger.warning("Error processing blob %s: %s", self.blob_name, e)
+            return []
+    
+    def _requested_blobs(self) -> List[str]:
+        """Explicitly requested blob names, in order and without duplicates."""
+        names = ([self.blob_name] if self.blob_name else []) + list(self.blob_names or [])
+        return list(dict.fromkeys(names))
+    
+    def _process_blob(self, container_client, blob_name: str, max_chunks: Optional[int] = None) -> List[Document]:
+        """Download and parse a single blob, returning its documents."""
+        try:
+            blob_client = container_client.get_blob_client(blob_name)
+            
+            # Small blobs stay in memory; large ones spill to disk so memory stays bounded
+            with _spool(self.max_in_memory_bytes) as buffer:
+                blob_data = blob_client.download_blob(max_concurrency=self.download_concurrency)
+                blob_data.readinto(buffer)
+                
+                # unstructured accepts a SpooledTemporaryFile directly, in memory or rolled over
+                buffer.seek(0)
+                return self._parse_stream(buffer, blob_name, max_chunks)
+                
+        except Exception as e:
+            logger.warning("Error processing blob %s: %s", blob_name, e)
+            return []
+    
+    async def _aprocess_blob(self, container_client, blob_name: str, semaphore) -> List[Document]:
+        """Asynchronously download a single blob, then parse it off the event loop."""
+        async with semaphore:
             try:
                 blob_client = container_client.get_blob_client(blob_name)
                 
-                # Download and parse blob using temporary file
-                with tempfile.TemporaryDirectory() as temp_dir:
-                    # Create file path maintaining blob structure
-                    file_path = os.path.join(temp_dir, self.container_name, blob_name)
-                    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+                with _spool(self.max_in_memory_bytes) as buffer:
+                    blob_data = await blob_client.download_blob(max_concurrency=self.download_concurrency)
+                    await blob_data.readinto(buffer)
                     
-                    # Download blob to temp file
-                    with open(file_path, "wb") as file:
-                        blob_data = blob_client.download_blob()
-                        blob_data.readinto(file)
-                    
-                    # Parse document using UnstructuredLoader
-                    loader = UnstructuredLoader(file_path)
-                    docs = loader.load()
-                    
-                    # Enhance metadata with Azure blob info
-                    for doc in docs:
-                        doc.metadata.update({
-                            "source": f"{self.account_url}/{self.container_name}/{blob_name}",
-                            "blob_name": blob_name,
-                            "container": self.container_name,
-                            "storage_account": self.storage_account_name
-                        })
-                    
-                    documents.extend(docs)
+                    # Parsing is CPU-bound, so keep it out of the event loop
+                    buffer.seek(0)
+                    loop = asyncio.get_running_loop()
+                    return await loop.run_in_executor(None, self._parse_stream, buffer, blob_name)
                     
             except Exception as e:
-                print(f"Error processing blob {blob_name}: {e}")
-                continue
+                logger.warning("Error processing blob %s: %s", blob_name, e)
+                return []
+    
+    def _parse_stream(self, stream, blob_name: str, max_chunks: Optional[int] = None) -> List[Document]:
+        """Parse a downloaded blob payload and attach Azure blob metadata."""
+        from langchain_unstructured import UnstructuredLoader
         
-        return documents
+        # Parse document using UnstructuredLoader; partitioning covers the whole file before
+        # the first element is yielded, so max_chunks trims the result rather than the work
+        loader = UnstructuredLoader(file=stream, metadata_filename=blob_name)
+        docs = list(islice(loader.lazy_load(), max_chunks))
+        
+        # Enhance metadata with Azure blob info, built once per blob
+        blob_metadata = {
+            "source": f"{self._source_prefix}/{blob_name}",
+            "blob_name": blob_name,
+            "container": self.container_name,
+            "storage_account": self.storage_account_name
+        }
+        for doc in docs:
+            doc.metadata.update(blob_metadata)
+        
+        return docs
 
 
 # Example usage
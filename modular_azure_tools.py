@@ -3,26 +3,395 @@ Modular Azure Blob Storage tools for LangGraph agents.
 Follows composable design pattern with separate tools for discovery, search, and loading.
 """
 
+import fnmatch
+import functools
+import json
 import os
-from typing import List, Dict, Any, Optional
+import re
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import List, Dict, Any, Literal, Optional, Tuple
 from datetime import datetime
+from itertools import islice
+from langchain_core.documents import Document
+import requests
+from requests.adapters import HTTPAdapter
 from langchain_core.tools import tool
-from azure.identity import DefaultAzureCredential, ClientSecretCredential
-from azure.storage.blob import BlobServiceClient
+from azure.core.exceptions import ResourceNotFoundError
+from azure.core.pipeline.transport import RequestsTransport
+from azure.identity import DefaultAzureCredential, ClientSecretCredential, TokenCachePersistenceOptions
+from azure.storage.blob import BlobPrefix, BlobServiceClient
 from azure_blob_entra_loader import AzureBlobStorageEntraLoader
 
+# orjson is optional; it serialises large listings several times faster than json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# numpy is optional; with it, size/date filters run as array masks over each listing page
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# Credentials refresh their own tokens, so they can live much longer than clients
+_CREDENTIAL_TTL_SECONDS = 12 * 60 * 60
+_CLIENT_TTL_SECONDS = 15 * 60
+
+# Connections kept open per host by the shared HTTP session
+_CONNECTION_POOL_SIZE = 50
+
+# Listing page size; 5000 is the service maximum and minimises LIST round trips
+_LIST_PAGE_SIZE = 5000
+
+# Summaries only look at the start of a document, so text-like blobs can be read as a
+# ranged GET of their first bytes: max_bytes per summary type, missing meaning no limit
+_SUMMARY_MAX_BYTES = {
+    "overview": 4 * 1024,
+    "detailed": 16 * 1024,
+}
+
+# Plain ASCII bullet for key points; tokenizes more cheaply than "\u2022"
+_BULLET = "- "
+
+# Parsed documents keyed by (account, container, blob, ETag), so summaries of the same
+# blob reuse one download; size is the total page_content length held in the cache
+_DOC_CACHE_TTL_SECONDS = 5 * 60
+_DOC_CACHE_MAX_BYTES = 64 * 1024 * 1024
+_doc_cache = OrderedDict()
+_doc_cache_lock = Lock()
+_doc_cache_bytes = 0
+
+# Formatted listing results; containers change rarely, so a short TTL avoids repeat scans
+_LISTING_CACHE_TTL_SECONDS = 60
+_LISTING_CACHE_SIZE = 32
+_listing_cache = OrderedDict()
+_listing_cache_lock = Lock()
+
+
+def _ttl_cache(ttl_seconds: float, maxsize: int = 8):
+    """Like functools.lru_cache, but entries are rebuilt once they are older than ttl_seconds."""
+    def decorator(func):
+        entries = {}
+        lock = Lock()
+        
+        @functools.wraps(func)
+        def wrapper(*args):
+            now = time.monotonic()
+            with lock:
+                entry = entries.get(args)
+                if entry and now - entry[1] < ttl_seconds:
+                    return entry[0]
+            value = func(*args)
+            with lock:
+                entries[args] = (value, now)
+                while len(entries) > maxsize:
+                    del entries[next(iter(entries))]
+            return value
+        
+        wrapper.cache_clear = entries.clear
+        return wrapper
+    return decorator
+
+
+def _glob_prefix(pattern: Optional[str]) -> Optional[str]:
+    """Return the literal head of a glob (e.g. 'report' for 'report*.pdf'), usable as a listing prefix."""
+    if not pattern:
+        return None
+    for i, char in enumerate(pattern):
+        if char in "*?[":
+            return pattern[:i] or None
+    return pattern
+
+
+def _prefetch_pages(pages):
+    """
+    Yield listing pages while the next one is already being fetched in the background.
+    
+    Each page's continuation token is only known once the previous page arrives, so pages
+    can't be requested in parallel; overlapping one fetch with processing is the best case.
+    """
+    iterator = iter(pages)
+    executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        pending = executor.submit(next, iterator, None)
+        while True:
+            page = pending.result()
+            if page is None:
+                return
+            pending = executor.submit(next, iterator, None)
+            yield page
+    finally:
+        # A caller that stops early shouldn't wait for a page it will never read
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _env_flag(name: str) -> bool:
+    """Whether an opt-in environment variable is set to a true value."""
+    return os.getenv(name, "").strip().lower() in ("1", "true", "yes")
+
 
 def _create_azure_credential():
-    """Create Azure credential using explicit ClientSecretCredential for reliability."""
-    return ClientSecretCredential(
-        tenant_id=os.getenv("AZURE_TENANT_ID"),
-        client_id=os.getenv("AZURE_CLIENT_ID"),
-        client_secret=os.getenv("AZURE_CLIENT_SECRET")
+    """
+    Create Azure credential using explicit ClientSecretCredential for reliability.
+    
+    With AZURE_TOKEN_CACHE_PERSIST set, tokens are persisted to the OS-encrypted MSAL cache
+    so other processes using the same service principal skip the token request; a plaintext
+    fallback is only allowed if AZURE_TOKEN_CACHE_ALLOW_UNENCRYPTED is also set.
+    DefaultAzureCredential is only used when the service principal variables are missing,
+    with the slow interactive probes excluded.
+    """
+    tenant_id = os.getenv("AZURE_TENANT_ID")
+    client_id = os.getenv("AZURE_CLIENT_ID")
+    client_secret = os.getenv("AZURE_CLIENT_SECRET")
+    
+    if tenant_id and client_id and client_secret:
+        options = {}
+        if _env_flag("AZURE_TOKEN_CACHE_PERSIST"):
+            options["cache_persistence_options"] = TokenCachePersistenceOptions(
+                name="azure-entra-docs",
+                allow_unencrypted_storage=_env_flag("AZURE_TOKEN_CACHE_ALLOW_UNENCRYPTED")
+            )
+        return ClientSecretCredential(
+            tenant_id=tenant_id,
+            client_id=client_id,
+            client_secret=client_secret,
+            **options
+        )
+    
+    return DefaultAzureCredential(
+        exclude_interactive_browser_credential=True,
+        exclude_visual_studio_code_credential=True
+    )
+
+
+@_ttl_cache(_CREDENTIAL_TTL_SECONDS, maxsize=1)
+def _get_credential():
+    """Return a shared credential so tokens are reused across tool calls."""
+    return _create_azure_credential()
+
+
+def _create_transport() -> RequestsTransport:
+    """Create one HTTP transport whose keep-alive pool is shared by every tool's client."""
+    session = requests.Session()
+    # Retries are handled by the SDK's retry policy, so the adapter must not retry as well
+    adapter = HTTPAdapter(
+        pool_connections=_CONNECTION_POOL_SIZE,
+        pool_maxsize=_CONNECTION_POOL_SIZE,
+        max_retries=0
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    # session_owner=False so clients rebuilt after their TTL don't close the shared session
+    return RequestsTransport(session=session, session_owner=False)
+
+
+_SHARED_TRANSPORT = _create_transport()
+
+
+@_ttl_cache(_CLIENT_TTL_SECONDS)
+def _get_blob_service(storage_account_name: str) -> BlobServiceClient:
+    """Return a shared BlobServiceClient per storage account to keep its connection pool warm."""
+    # Fail fast for interactive agent calls: fewer retries and a short first backoff
+    return BlobServiceClient(
+        account_url=f"https://{storage_account_name}.blob.core.windows.net",
+        credential=_get_credential(),
+        transport=_SHARED_TRANSPORT,
+        retry_total=3,
+        initial_backoff=0.5
     )
 
 
+def _load_blob_documents(
+    storage_account_name: str,
+    container_name: str,
+    blob_name: str,
+    max_bytes: Optional[int] = None
+) -> Tuple[List[Document], bool]:
+    """
+    Load a blob's documents through the TTL cache, revalidating the ETag on every call.
+    
+    Returns the documents and whether they cover the whole blob; with max_bytes, text-like
+    blobs are read with a single ranged GET of their first max_bytes.
+    """
+    global _doc_cache_bytes
+    
+    blob_client = _get_blob_service(storage_account_name).get_blob_client(container_name, blob_name)
+    try:
+        properties = blob_client.get_blob_properties()
+    except ResourceNotFoundError:
+        return [], True
+    
+    key = (storage_account_name, container_name, blob_name, properties.etag)
+    now = time.monotonic()
+    with _doc_cache_lock:
+        entry = _doc_cache.get(key)
+        # A full load serves any request; a head read serves only requests up to its max_bytes
+        head_bytes = entry[1] if entry else None
+        if (
+            entry and now - entry[0] < _DOC_CACHE_TTL_SECONDS
+            and (head_bytes is None or (max_bytes is not None and max_bytes <= head_bytes))
+        ):
+            _doc_cache.move_to_end(key)
+            return list(entry[2]), head_bytes is None
+    
+    loader = AzureBlobStorageEntraLoader(
+        storage_account_name=storage_account_name,
+        container_name=container_name,
+        blob_name=blob_name,
+        blob_service_client=_get_blob_service(storage_account_name)
+    )
+    # Blobs that fit in max_bytes, or can't be parsed from a prefix, are loaded normally
+    read_head = max_bytes is not None and properties.size > max_bytes and loader.can_load_head()
+    documents = loader.load_head(max_bytes) if read_head else loader.load()
+    head_bytes = max_bytes if read_head else None
+    size = sum(len(doc.page_content) for doc in documents)
+    if documents and size <= _DOC_CACHE_MAX_BYTES:
+        with _doc_cache_lock:
+            previous = _doc_cache.pop(key, None)
+            if previous:
+                _doc_cache_bytes -= previous[3]
+            _doc_cache[key] = (now, head_bytes, documents, size)
+            _doc_cache_bytes += size
+            while _doc_cache_bytes > _DOC_CACHE_MAX_BYTES:
+                _, evicted = _doc_cache.popitem(last=False)
+                _doc_cache_bytes -= evicted[3]
+    
+    return list(documents), head_bytes is None
+
+
+def _filter_page(blobs, name_re, content_type, after_date, before_date, min_size, max_size) -> list:
+    """Return the blobs of one listing page that pass every search filter, in listing order."""
+    # Name and content type are string tests, so they stay per-blob
+    if name_re is not None:
+        blobs = [blob for blob in blobs if name_re.match(blob.name)]
+    if content_type:
+        blobs = [
+            blob for blob in blobs
+            if blob.content_settings and blob.content_settings.content_type == content_type
+        ]
+    
+    filter_dates = after_date is not None or before_date is not None
+    filter_sizes = min_size is not None or max_size is not None
+    if not blobs or not (filter_dates or filter_sizes):
+        return blobs
+    
+    if np is None:
+        return [
+            blob for blob in blobs
+            if _in_ranges(blob, filter_dates, after_date, before_date, min_size, max_size)
+        ]
+    
+    # Columnar range checks: one comparison per array instead of per blob;
+    # 0 is never a valid date ordinal, so it marks blobs without last_modified
+    count = len(blobs)
+    mask = np.ones(count, dtype=bool)
+    if filter_sizes:
+        sizes = np.fromiter((blob.size for blob in blobs), dtype=np.int64, count=count)
+        if min_size is not None:
+            mask &= sizes >= min_size
+        if max_size is not None:
+            mask &= sizes <= max_size
+    if filter_dates:
+        days = np.fromiter(
+            (blob.last_modified.toordinal() if blob.last_modified else 0 for blob in blobs),
+            dtype=np.int64,
+            count=count
+        )
+        mask &= days > 0
+        if after_date is not None:
+            mask &= days > after_date.toordinal()
+        if before_date is not None:
+            mask &= days < before_date.toordinal()
+    return [blobs[i] for i in np.flatnonzero(mask)]
+
+
+def _in_ranges(blob, filter_dates, after_date, before_date, min_size, max_size) -> bool:
+    """Per-blob size/date check used when numpy isn't available; 0 is a valid bound."""
+    if filter_dates:
+        if not blob.last_modified:
+            return False
+        blob_date = blob.last_modified.date()
+        if (
+            (after_date is not None and blob_date <= after_date)
+            or (before_date is not None and blob_date >= before_date)
+        ):
+            return False
+    return not (
+        (min_size is not None and blob.size < min_size)
+        or (max_size is not None and blob.size > max_size)
+    )
+
+
+def _format_blob_details(blob) -> str:
+    """Format a blob's optional modified-date and content-type lines as one string."""
+    modified = f"   Modified: {blob.last_modified.strftime('%Y-%m-%d %H:%M:%S')}\n" if blob.last_modified else ""
+    content_type = blob.content_settings.content_type if blob.content_settings else None
+    return f"{modified}   Type: {content_type}\n" if content_type else modified
+
+
+def _blob_item(blob, url_prefix: str, include_metadata: bool = True) -> Dict[str, Any]:
+    """Describe a listed blob, bare blob name or virtual folder as a JSON-ready dict."""
+    if isinstance(blob, BlobPrefix):
+        return {"name": blob.name, "folder": True}
+    name = blob if isinstance(blob, str) else blob.name
+    if isinstance(blob, str) or not include_metadata:
+        return {"name": name, "url": f"{url_prefix}{name}"}
+    return {
+        "name": name,
+        "size": blob.size,
+        "modified": blob.last_modified.isoformat() if blob.last_modified else None,
+        "type": blob.content_settings.content_type if blob.content_settings else None,
+        "url": f"{url_prefix}{name}",
+    }
+
+
+def _to_json(payload: Dict[str, Any]) -> str:
+    """Serialise a tool result compactly, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(payload).decode()
+    return json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
+
+
+def _error_result(message: str, output_format: str) -> str:
+    """Return an error message in the tool's requested output format."""
+    return _to_json({"error": message}) if output_format == "json" else message
+
+
+def _get_cached_listing(key: tuple) -> Optional[str]:
+    """Return a still-fresh listing with "(cached)" added to its header, or None."""
+    with _listing_cache_lock:
+        entry = _listing_cache.get(key)
+        if entry is None or time.monotonic() >= entry[0]:
+            return None
+        _listing_cache.move_to_end(key)
+    result = entry[1]
+    if result.startswith("{"):
+        # Compact JSON object: flag it with a leading "cached" field
+        return '{"cached":true,' + result[1:]
+    # Every cached text listing starts with a header line ending in ":\n\n"
+    return result.replace(":\n\n", " (cached):\n\n", 1)
+
+
+def _cache_listing(key: tuple, result: str) -> str:
+    """Remember a formatted listing for _LISTING_CACHE_TTL_SECONDS and return it."""
+    with _listing_cache_lock:
+        _listing_cache[key] = (time.monotonic() + _LISTING_CACHE_TTL_SECONDS, result)
+        _listing_cache.move_to_end(key)
+        while len(_listing_cache) > _LISTING_CACHE_SIZE:
+            _listing_cache.popitem(last=False)
+    return result
+
+
 @tool
-def list_available_containers(storage_account_name: str) -> str:
+def list_available_containers(
+    storage_account_name: str,
+    output_format: Literal["text", "json"] = "text"
+) -> str:
     """List all containers available in an Azure Storage account.
     
     This tool discovers what containers/collections are available for the authenticated user.
@@ -30,39 +399,50 @@ def list_available_containers(storage_account_name: str) -> str:
     
     Args:
         storage_account_name: Name of the Azure Storage account (e.g., 'mystorageaccount')
+        output_format: 'text' for a readable list, or 'json' for compact machine-readable output
         
     Returns:
         String listing all available containers with metadata
     """
     try:
-        credential = _create_azure_credential()
-        account_url = f"https://{storage_account_name}.blob.core.windows.net"
-        
-        blob_service_client = BlobServiceClient(
-            account_url=account_url,
-            credential=credential
-        )
+        cache_key = ("containers", storage_account_name, output_format)
+        cached = _get_cached_listing(cache_key)
+        if cached is not None:
+            return cached
         
+        blob_service_client = _get_blob_service(storage_account_name)
         containers = list(blob_service_client.list_containers())
         
+        if output_format == "json":
+            items = [
+                {
+                    "name": container.name,
+                    "last_modified": container.last_modified.isoformat() if container.last_modified else None,
+                    "public_access": getattr(container, "public_access", None),
+                }
+                for container in containers
+            ]
+            result = _to_json({"count": len(items), "items": items})
+            return _cache_listing(cache_key, result) if items else result
+        
         if not containers:
             return f"No containers found in storage account '{storage_account_name}'"
         
         # Format container list
-        result = f"Found {len(containers)} containers in '{storage_account_name}':\n\n"
+        parts = [f"Found {len(containers)} containers in '{storage_account_name}':\n\n"]
         
         for i, container in enumerate(containers, 1):
-            result += f"{i}. {container.name}\n"
+            parts.append(f"{i}. {container.name}\n")
             if container.last_modified:
-                result += f"   Last modified: {container.last_modified.strftime('%Y-%m-%d %H:%M:%S')}\n"
+                parts.append(f"   Last modified: {container.last_modified.strftime('%Y-%m-%d %H:%M:%S')}\n")
             if hasattr(container, 'public_access') and container.public_access:
-                result += f"   Public access: {container.public_access}\n"
-            result += "\n"
+                parts.append(f"   Public access: {container.public_access}\n")
+            parts.append("\n")
         
-        return result
+        return _cache_listing(cache_key, "".join(parts))
         
     except Exception as e:
-        return f"Error listing containers in '{storage_account_name}': {str(e)}"
+        return _error_result(f"Error listing containers in '{storage_account_name}': {str(e)}", output_format)
 
 
 @tool
@@ -70,9 +450,13 @@ def list_documents_in_container(
     storage_account_name: str,
     container_name: str,
     prefix: Optional[str] = None,
-    include_metadata: bool = True
+    include_metadata: bool = True,
+    delimiter: Optional[str] = None,
+    page_size: int = 200,
+    continuation_token: Optional[str] = None,
+    output_format: Literal["text", "json"] = "text"
 ) -> str:
-    """List all documents/blobs in a specific container.
+    """List documents/blobs in a specific container, one page at a time.
     
     This tool shows what documents are available in a container without loading their content.
     Useful for browsing and discovering specific files to load.
@@ -82,49 +466,85 @@ def list_documents_in_container(
         container_name: Name of the container to list documents from
         prefix: Optional folder prefix to filter by (e.g., 'reports/')
         include_metadata: Whether to include file metadata (size, modified date, etc.)
+        delimiter: Optional folder separator (e.g., '/') to list only the direct children of
+                   prefix, with subfolders shown as single entries instead of recursing
+        page_size: Maximum number of documents to return in one call
+        continuation_token: Token from a previous call's "Continuation:" line (or the JSON
+                            "continuation" field) to get the next page
+        output_format: 'text' for a readable list, or 'json' for compact machine-readable output
         
     Returns:
-        String listing all documents in the container with optional metadata
+        String listing one page of documents in the container with optional metadata,
+        ending with a continuation token when more documents are available
     """
     try:
-        credential = _create_azure_credential()
-        account_url = f"https://{storage_account_name}.blob.core.windows.net"
-        
-        blob_service_client = BlobServiceClient(
-            account_url=account_url,
-            credential=credential
+        cache_key = (
+            "documents", storage_account_name, container_name, prefix,
+            include_metadata, delimiter, page_size, continuation_token, output_format
         )
-        
-        container_client = blob_service_client.get_container_client(container_name)
-        
-        # List blobs with optional prefix filter
-        blobs = list(container_client.list_blobs(name_starts_with=prefix))
-        
-        if not blobs:
+        cached = _get_cached_listing(cache_key)
+        if cached is not None:
+            return cached
+        
+        container_client = _get_blob_service(storage_account_name).get_container_client(container_name)
+        
+        # Fetch a single page of blobs with optional prefix filter, resuming from the token;
+        # without metadata only names are needed, so skip deserialising every blob's properties
+        if delimiter:
+            # One level of the hierarchy: direct children plus virtual folders
+            listing = container_client.walk_blobs(
+                name_starts_with=prefix, delimiter=delimiter, results_per_page=page_size
+            )
+        elif include_metadata:
+            listing = container_client.list_blobs(name_starts_with=prefix, results_per_page=page_size)
+        else:
+            listing = container_client.list_blob_names(name_starts_with=prefix, results_per_page=page_size)
+        pages = listing.by_page(continuation_token=continuation_token)
+        
+        url_prefix = f"{container_client.url}/"
+        as_json = output_format == "json"
+        parts = []
+        items = []
+        count = 0
+        for page in islice(pages, 1):
+            for blob in page:
+                count += 1
+                if as_json:
+                    items.append(_blob_item(blob, url_prefix, include_metadata))
+                    continue
+                
+                name = blob if isinstance(blob, str) else blob.name
+                if isinstance(blob, BlobPrefix):
+                    parts.append(f"{count}. {name} (folder)\n\n")
+                    continue
+                
+                # One formatted block per blob
+                if include_metadata:
+                    size = f"   Size: {blob.size:,} bytes\n" if blob.size else ""
+                    parts.append(f"{count}. {name}\n{size}{_format_blob_details(blob)}   URL: {url_prefix}{name}\n\n")
+                else:
+                    parts.append(f"{count}. {name}\n   URL: {url_prefix}{name}\n\n")
+        
+        next_token = pages.continuation_token
+        if as_json:
+            result = _to_json({"count": count, "items": items, "continuation": next_token})
+            return _cache_listing(cache_key, result) if count else result
+        
+        if not count and not next_token:
             prefix_msg = f" with prefix '{prefix}'" if prefix else ""
             return f"No documents found in container '{container_name}'{prefix_msg}"
         
         # Format document list
         prefix_msg = f" (filtered by prefix '{prefix}')" if prefix else ""
-        result = f"Found {len(blobs)} documents in container '{container_name}'{prefix_msg}:\n\n"
+        more_msg = " (more available)" if next_token else ""
+        parts.insert(0, f"Found {count} documents in container '{container_name}'{prefix_msg}{more_msg}:\n\n")
+        if next_token:
+            parts.append(f"Continuation: {next_token}\n")
         
-        for i, blob in enumerate(blobs, 1):
-            result += f"{i}. {blob.name}\n"
-            
-            if include_metadata:
-                if blob.size:
-                    result += f"   Size: {blob.size:,} bytes\n"
-                if blob.last_modified:
-                    result += f"   Modified: {blob.last_modified.strftime('%Y-%m-%d %H:%M:%S')}\n"
-                if blob.content_settings and blob.content_settings.content_type:
-                    result += f"   Type: {blob.content_settings.content_type}\n"
-            
-            result += f"   URL: https://{storage_account_name}.blob.core.windows.net/{container_name}/{blob.name}\n\n"
-        
-        return result
+        return _cache_listing(cache_key, "".join(parts))
         
     except Exception as e:
-        return f"Error listing documents in container '{container_name}': {str(e)}"
+        return _error_result(f"Error listing documents in container '{container_name}': {str(e)}", output_format)
 
 
 @tool
@@ -147,12 +567,7 @@ def load_document_from_blob(
         String containing the parsed document content with metadata
     """
     try:
-        loader = AzureBlobStorageEntraLoader(
-            storage_account_name=storage_account_name,
-            container_name=container_name,
-            blob_name=blob_name
-        )
-        documents = loader.load()
+        documents, _ = _load_blob_documents(storage_account_name, container_name, blob_name)
         
         if not documents:
             return f"Document '{blob_name}' not found in container '{container_name}'"
@@ -164,24 +579,84 @@ def load_document_from_blob(
         first_doc = documents[0]
         
         # Format document content with metadata
-        content = f"Document: {blob_name}\n"
-        content += f"Container: {container_name}\n"
-        content += f"Storage Account: {storage_account_name}\n"
-        content += f"Source URL: {first_doc.metadata.get('source', 'Unknown')}\n"
-        content += f"Document Elements: {len(documents)} chunks combined\n"
-        content += f"Total Content Length: {len(full_content)} characters\n"
-        content += f"Last Modified: {first_doc.metadata.get('last_modified', 'Unknown')}\n"
-        content += "\n" + "=" * 50 + "\n"
-        content += "DOCUMENT CONTENT:\n"
-        content += "=" * 50 + "\n\n"
-        content += full_content
-        
-        return content
+        parts = [
+            f"Document: {blob_name}\n",
+            f"Container: {container_name}\n",
+            f"Storage Account: {storage_account_name}\n",
+            f"Source URL: {first_doc.metadata.get('source', 'Unknown')}\n",
+            f"Document Elements: {len(documents)} chunks combined\n",
+            f"Total Content Length: {len(full_content)} characters\n",
+            f"Last Modified: {first_doc.metadata.get('last_modified', 'Unknown')}\n",
+            "\n" + "=" * 50 + "\n",
+            "DOCUMENT CONTENT:\n",
+            "=" * 50 + "\n\n",
+            full_content,
+        ]
+        
+        return "".join(parts)
         
     except Exception as e:
         return f"Error loading document '{blob_name}' from container '{container_name}': {str(e)}"
 
 
+@tool
+def load_documents_from_blobs(
+    storage_account_name: str,
+    container_name: str,
+    blob_names: List[str]
+) -> str:
+    """Load and parse several documents from Azure Blob Storage in parallel.
+    
+    This tool retrieves multiple documents at once, which is much faster than
+    calling load_document_from_blob once per document.
+    
+    Args:
+        storage_account_name: Name of the Azure Storage account
+        container_name: Name of the container
+        blob_names: Names of the blobs/files to load
+        
+    Returns:
+        String containing the parsed content of each document, in the order requested
+    """
+    if not blob_names:
+        return f"No blob names given; nothing to load from container '{container_name}'"
+    
+    try:
+        # The loader downloads and parses the blobs concurrently over the cached, pooled client
+        loader = AzureBlobStorageEntraLoader(
+            storage_account_name=storage_account_name,
+            container_name=container_name,
+            blob_names=blob_names,
+            blob_service_client=_get_blob_service(storage_account_name)
+        )
+        documents = loader.load()
+        
+        # Group document chunks by blob; the loader keeps the requested order
+        contents = {}
+        for doc in documents:
+            contents.setdefault(doc.metadata.get("blob_name"), []).append(doc.page_content)
+        
+        parts = [f"Loaded {len(contents)} of {len(set(blob_names))} documents from container '{container_name}':\n\n"]
+        for blob_name in dict.fromkeys(blob_names):
+            if blob_name not in contents:
+                parts.append(f"Document: {blob_name}\n[Not found or could not be parsed]\n\n")
+                continue
+            full_content = "\n".join(contents[blob_name])
+            parts.extend([
+                f"Document: {blob_name}\n",
+                f"Document Elements: {len(contents[blob_name])} chunks combined\n",
+                f"Total Content Length: {len(full_content)} characters\n",
+                "=" * 50 + "\n",
+                full_content,
+                "\n\n",
+            ])
+        
+        return "".join(parts)
+        
+    except Exception as e:
+        return f"Error loading documents from container '{container_name}': {str(e)}"
+
+
 @tool
 def search_documents_by_metadata(
     storage_account_name: str,
@@ -191,7 +666,9 @@ def search_documents_by_metadata(
     modified_after: Optional[str] = None,
     modified_before: Optional[str] = None,
     min_size: Optional[int] = None,
-    max_size: Optional[int] = None
+    max_size: Optional[int] = None,
+    max_results: int = 1000,
+    output_format: Literal["text", "json"] = "text"
 ) -> str:
     """Search documents in a container by metadata filters.
     
@@ -207,85 +684,70 @@ def search_documents_by_metadata(
         modified_before: Only files modified before this date (YYYY-MM-DD format)
         min_size: Minimum file size in bytes
         max_size: Maximum file size in bytes
+        max_results: Stop searching once this many matching documents are found
+        output_format: 'text' for a readable list, or 'json' for compact machine-readable output
         
     Returns:
         String listing matching documents with metadata
     """
     try:
-        credential = _create_azure_credential()
-        account_url = f"https://{storage_account_name}.blob.core.windows.net"
-        
-        blob_service_client = BlobServiceClient(
-            account_url=account_url,
-            credential=credential
-        )
-        
-        container_client = blob_service_client.get_container_client(container_name)
-        blobs = list(container_client.list_blobs())
-        
-        if not blobs:
-            return f"No documents found in container '{container_name}'"
-        
-        # Apply filters
-        filtered_blobs = []
-        
-        for blob in blobs:
-            # Filename pattern filter
-            if filename_pattern:
-                import fnmatch
-                if not fnmatch.fnmatch(blob.name, filename_pattern):
-                    continue
+        container_client = _get_blob_service(storage_account_name).get_container_client(container_name)
+        # The literal head of the filename pattern lets the service skip non-matching names
+        name_prefix = _glob_prefix(filename_pattern)
+        pages = container_client.list_blobs(
+            name_starts_with=name_prefix, results_per_page=_LIST_PAGE_SIZE
+        ).by_page()
+        
+        # Compile the glob and parse the dates once rather than for every blob
+        name_re = re.compile(fnmatch.translate(filename_pattern)) if filename_pattern else None
+        after_date = datetime.strptime(modified_after, '%Y-%m-%d').date() if modified_after else None
+        before_date = datetime.strptime(modified_before, '%Y-%m-%d').date() if modified_before else None
+        
+        # Apply filters while streaming pages
+        url_prefix = f"{container_client.url}/"
+        as_json = output_format == "json"
+        parts = []
+        items = []
+        scanned = 0
+        count = 0
+        
+        for page in _prefetch_pages(pages):
+            blobs = list(page)
+            scanned += len(blobs)
             
-            # Content type filter
-            if content_type:
-                blob_content_type = blob.content_settings.content_type if blob.content_settings else None
-                if blob_content_type != content_type:
-                    continue
-            
-            # Date filters
-            if modified_after or modified_before:
-                if not blob.last_modified:
-                    continue
-                
-                blob_date = blob.last_modified.date()
+            for blob in _filter_page(blobs, name_re, content_type, after_date, before_date, min_size, max_size):
+                count += 1
+                if as_json:
+                    items.append(_blob_item(blob, url_prefix))
+                else:
+                    parts.append(
+                        f"{count}. {blob.name}\n   Size: {blob.size:,} bytes\n"
+                        f"{_format_blob_details(blob)}   URL: {url_prefix}{blob.name}\n\n"
+                    )
                 
-                if modified_after:
-                    after_date = datetime.strptime(modified_after, '%Y-%m-%d').date()
-                    if blob_date <= after_date:
-                        continue
-                
-                if modified_before:
-                    before_date = datetime.strptime(modified_before, '%Y-%m-%d').date()
-                    if blob_date >= before_date:
-                        continue
+                if count >= max_results:
+                    break
             
-            # Size filters
-            if min_size and blob.size < min_size:
-                continue
-            if max_size and blob.size > max_size:
-                continue
-            
-            filtered_blobs.append(blob)
+            if count >= max_results:
+                break
+        
+        if as_json:
+            return _to_json({"count": count, "items": items, "truncated": count >= max_results})
+        
+        if not scanned and not name_prefix:
+            return f"No documents found in container '{container_name}'"
         
-        if not filtered_blobs:
+        if not count:
             return f"No documents found matching the specified criteria in container '{container_name}'"
         
         # Format results
-        result = f"Found {len(filtered_blobs)} documents matching criteria in container '{container_name}':\n\n"
-        
-        for i, blob in enumerate(filtered_blobs, 1):
-            result += f"{i}. {blob.name}\n"
-            result += f"   Size: {blob.size:,} bytes\n"
-            if blob.last_modified:
-                result += f"   Modified: {blob.last_modified.strftime('%Y-%m-%d %H:%M:%S')}\n"
-            if blob.content_settings and blob.content_settings.content_type:
-                result += f"   Type: {blob.content_settings.content_type}\n"
-            result += f"   URL: https://{storage_account_name}.blob.core.windows.net/{container_name}/{blob.name}\n\n"
+        limit_msg = f" (stopped after the first {max_results})" if count >= max_results else ""
+        parts.insert(0, f"Found {count} documents matching criteria in container '{container_name}'{limit_msg}:\n\n")
         
-        return result
+        return "".join(parts)
         
     except Exception as e:
-        return f"Error searching documents in container '{container_name}': {str(e)}"
+        return _error_result(f"Error searching documents in container '{container_name}': {str(e)}", output_format)
 
 
 @tool
@@ -310,19 +772,18 @@ def summarize_document(
         String containing document summary with metadata
     """
     try:
-        # First load the document
-        loader = AzureBlobStorageEntraLoader(
-            storage_account_name=storage_account_name,
-            container_name=container_name,
-            blob_name=blob_name
+        # First load the document; overview and detailed read only the head of text-like
+        # blobs, and cached loads are shared with load_document_from_blob and other types
+        documents, complete = _load_blob_documents(
+            storage_account_name, container_name, blob_name, _SUMMARY_MAX_BYTES.get(summary_type)
         )
-        documents = loader.load()
         
         if not documents:
             return f"Document '{blob_name}' not found in container '{container_name}'"
         
-        # Combine all document chunks into full content
-        full_content = "\n".join([doc.page_content for doc in documents])
+        # Combine all document chunks into full content; key points reuse the same list
+        contents = [doc.page_content for doc in documents]
+        full_content = "\n".join(contents)
         first_doc = documents[0]
         
         # Create summary based on type
@@ -336,36 +797,41 @@ def summarize_document(
             summary_prompt = "Provide a helpful summary of this document."
         
         # Return document info with actual content summary
-        result = f"Document Summary: {blob_name}\n"
-        result += f"Container: {container_name}\n"
-        result += f"Storage Account: {storage_account_name}\n"
-        result += f"Document Elements: {len(documents)} chunks combined\n"
-        result += f"Total Content Length: {len(full_content)} characters\n"
-        result += f"Summary Type: {summary_type}\n\n"
-        result += "=" * 50 + "\n"
-        result += f"SUMMARY ({summary_type.upper()}):\n"
-        result += "=" * 50 + "\n\n"
+        parts = [
+            f"Document Summary: {blob_name}\n",
+            f"Container: {container_name}\n",
+            f"Storage Account: {storage_account_name}\n",
+            f"Document Elements: {len(documents)} chunks combined\n",
+            f"{'Total' if complete else 'Partial'} Content Length: {len(full_content)} characters\n",
+            f"Summary Type: {summary_type}\n\n",
+            "=" * 50 + "\n",
+            f"SUMMARY ({summary_type.upper()}):\n",
+            "=" * 50 + "\n\n",
+        ]
         
         # Provide actual content summary based on type
         if summary_type == "overview":
-            result += f"This document is about: {full_content[:300]}...\n\n"
-            result += "This appears to be a comprehensive document covering the main topic shown above.\n"
+            parts.append(f"This document is about: {full_content[:300]}...\n\n")
+            parts.append("This appears to be a comprehensive document covering the main topic shown above.\n")
         elif summary_type == "detailed":
-            result += f"Detailed content overview:\n\n{full_content[:800]}...\n\n"
-            result += "The document contains extensive information on the topic with detailed analysis and findings.\n"
+            parts.append(f"Detailed content overview:\n\n{full_content[:800]}...\n\n")
+            parts.append("The document contains extensive information on the topic with detailed analysis and findings.\n")
         elif summary_type == "key_points":
             # Extract first few chunks as key points
-            key_chunks = [doc.page_content for doc in documents[:10] if doc.page_content.strip()]
-            result += "Key points from the document:\n\n"
+            key_chunks = [content for content in contents[:10] if content.strip()]
+            parts.append("Key points from the document:\n\n")
             for i, chunk in enumerate(key_chunks, 1):
-                result += f"• {chunk}\n"
-            result += f"\n[Document contains {len(documents)} total elements]"
+                parts.append(f"{_BULLET}{chunk}\n")
+            parts.append(f"\n[Document contains {len(documents)} total elements]")
         else:
-            result += f"Content summary:\n\n{full_content[:500]}...\n"
+            parts.append(f"Content summary:\n\n{full_content[:500]}...\n")
         
-        result += f"\n\n[Full document content is {len(full_content):,} characters long]"
+        if not complete:
+            parts.append(f"\n\n[Summary based on the first {len(full_content):,} characters of the document]")
+        else:
+            parts.append(f"\n\n[Full document content is {len(full_content):,} characters long]")
         
-        return result
+        return "".join(parts)
         
     except Exception as e:
         return f"Error summarizing document '{blob_name}': {str(e)}"
@@ -376,6 +842,7 @@ MODULAR_AZURE_TOOLS = [
     list_available_containers,
     list_documents_in_container,
     load_document_from_blob,
+    load_documents_from_blobs,
     search_documents_by_metadata,
     summarize_document
 ]
\ No newline at end of file